@@ -0,0 +1,207 @@
+
+from frontend.args import _Attributes
+from _devbuild.gen.runtime_asdl import (
+   value, value_e, value_t, value__Bool, value__Int, value__Float, value__Str,
+)
+from typing import cast, Dict, Optional
+
+
+class cd(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.L = cast(value__Bool, attrs['L']).b  # type: bool
+    self.P = cast(value__Bool, attrs['P']).b  # type: bool
+
+
+class command(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.v = cast(value__Bool, attrs['v']).b  # type: bool
+
+
+class dirs(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.c = cast(value__Bool, attrs['c']).b  # type: bool
+    self.l = cast(value__Bool, attrs['l']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+    self.v = cast(value__Bool, attrs['v']).b  # type: bool
+
+
+class each(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['P']
+    self.P = -1 if val0.tag_() == value_e.Undef else cast(value__Int, val0).i  # type: int
+    val1 = attrs['s']
+    self.s = None if val1.tag_() == value_e.Undef else cast(value__Str, val1).s  # type: Optional[str]
+
+
+class echo(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.e = cast(value__Bool, attrs['e']).b  # type: bool
+    self.n = cast(value__Bool, attrs['n']).b  # type: bool
+
+
+class export_(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.f = cast(value__Bool, attrs['f']).b  # type: bool
+    self.n = cast(value__Bool, attrs['n']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+
+
+class hash(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.r = cast(value__Bool, attrs['r']).b  # type: bool
+
+
+class history(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.c = cast(value__Bool, attrs['c']).b  # type: bool
+    val1 = attrs['d']
+    self.d = -1 if val1.tag_() == value_e.Undef else cast(value__Int, val1).i  # type: int
+
+
+class main(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['ast_format']
+    self.ast_format = 'abbrev-text' if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+    val1 = attrs['c']
+    self.c = None if val1.tag_() == value_e.Undef else cast(value__Str, val1).s  # type: Optional[str]
+    self.compact_arena = cast(value__Bool, attrs['compact_arena']).b  # type: bool
+    val3 = attrs['completion_display']
+    self.completion_display = 'nice' if val3.tag_() == value_e.Undef else cast(value__Str, val3).s  # type: Optional[str]
+    val4 = attrs['debug_file']
+    self.debug_file = None if val4.tag_() == value_e.Undef else cast(value__Str, val4).s  # type: Optional[str]
+    self.help = cast(value__Bool, attrs['help']).b  # type: bool
+    self.i = cast(value__Bool, attrs['i']).b  # type: bool
+    self.no_posix_spawn = cast(value__Bool, attrs['no_posix_spawn']).b  # type: bool
+    self.one_pass_parse = cast(value__Bool, attrs['one_pass_parse']).b  # type: bool
+    val9 = attrs['parser_mem_dump']
+    self.parser_mem_dump = None if val9.tag_() == value_e.Undef else cast(value__Str, val9).s  # type: Optional[str]
+    self.print_status = cast(value__Bool, attrs['print_status']).b  # type: bool
+    val11 = attrs['profile']
+    self.profile = None if val11.tag_() == value_e.Undef else cast(value__Str, val11).s  # type: Optional[str]
+    val12 = attrs['rcfile']
+    self.rcfile = None if val12.tag_() == value_e.Undef else cast(value__Str, val12).s  # type: Optional[str]
+    val13 = attrs['runtime_mem_dump']
+    self.runtime_mem_dump = None if val13.tag_() == value_e.Undef else cast(value__Str, val13).s  # type: Optional[str]
+    val14 = attrs['trace_file']
+    self.trace_file = None if val14.tag_() == value_e.Undef else cast(value__Str, val14).s  # type: Optional[str]
+    self.version = cast(value__Bool, attrs['version']).b  # type: bool
+    self.xtrace_to_debug_file = cast(value__Bool, attrs['xtrace_to_debug_file']).b  # type: bool
+
+
+class new_var(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.A = cast(value__Bool, attrs['A']).b  # type: bool
+    self.F = cast(value__Bool, attrs['F']).b  # type: bool
+    self.a = cast(value__Bool, attrs['a']).b  # type: bool
+    self.f = cast(value__Bool, attrs['f']).b  # type: bool
+    self.g = cast(value__Bool, attrs['g']).b  # type: bool
+    val5 = attrs['n']
+    self.n = None if val5.tag_() == value_e.Undef else cast(value__Str, val5).s  # type: Optional[str]
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+    val7 = attrs['r']
+    self.r = None if val7.tag_() == value_e.Undef else cast(value__Str, val7).s  # type: Optional[str]
+    val8 = attrs['x']
+    self.x = None if val8.tag_() == value_e.Undef else cast(value__Str, val8).s  # type: Optional[str]
+
+
+class printf(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['v']
+    self.v = None if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+
+
+class pwd(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.L = cast(value__Bool, attrs['L']).b  # type: bool
+    self.P = cast(value__Bool, attrs['P']).b  # type: bool
+
+
+class read(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['a']
+    self.a = None if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+    val1 = attrs['d']
+    self.d = None if val1.tag_() == value_e.Undef else cast(value__Str, val1).s  # type: Optional[str]
+    val2 = attrs['n']
+    self.n = -1 if val2.tag_() == value_e.Undef else cast(value__Int, val2).i  # type: int
+    self.r = cast(value__Bool, attrs['r']).b  # type: bool
+
+
+class readonly(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.A = cast(value__Bool, attrs['A']).b  # type: bool
+    self.a = cast(value__Bool, attrs['a']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+
+
+class shopt(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.o = cast(value__Bool, attrs['o']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+    self.q = cast(value__Bool, attrs['q']).b  # type: bool
+    self.s = cast(value__Bool, attrs['s']).b  # type: bool
+    self.u = cast(value__Bool, attrs['u']).b  # type: bool
+
+
+class trap(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.l = cast(value__Bool, attrs['l']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+
+
+class type(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.P = cast(value__Bool, attrs['P']).b  # type: bool
+    self.f = cast(value__Bool, attrs['f']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+    self.t = cast(value__Bool, attrs['t']).b  # type: bool
+
+
+class unset(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.f = cast(value__Bool, attrs['f']).b  # type: bool
+    self.v = cast(value__Bool, attrs['v']).b  # type: bool
+
+
+class wait(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.n = cast(value__Bool, attrs['n']).b  # type: bool
+
@@ -0,0 +1,201 @@
+from asdl import pybase
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class value_e(object):
+  Str = 1
+  Array = 2
+
+_value_str = {
+  1: 'value.Str',
+  2: 'value.Array',
+}
+
+def value_str(tag):
+  # type: (int) -> str
+  return _value_str[tag]
+
+class value_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class value__Str(value_t):
+  tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('value.Str')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('value.Str')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class value__Array(value_t):
+  tag = 2
+  __slots__ = ('a',)
+
+  def __init__(self, a=None):
+    # type: (Optional[int]) -> None
+    self.a = a
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('value.Array')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('value.Array')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class value(object):
+  Str = value__Str
+  Array = value__Array
+
+class t2(pybase.CompoundObj):
+  tag = 1000
+  __slots__ = ('a', 'b')
+
+  def __init__(self, a=None, b=None):
+    # type: (Optional[int], Optional[int]) -> None
+    self.a = a
+    self.b = b
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t2')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t2')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class t3(pybase.CompoundObj):
+  tag = 1001
+  __slots__ = ('a', 'b')
+
+  def __init__(self, a=None, b=None):
+    # type: (Optional[int], Optional[int]) -> None
+    self.a = a
+    self.b = b
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t3')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t3')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class t4(pybase.CompoundObj):
+  tag = 1002
+  __slots__ = ('a', 'b')
+
+  def __init__(self, a=None, b=None):
+    # type: (Optional[int], Optional[int]) -> None
+    self.a = a
+    self.b = b
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t4')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t4')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
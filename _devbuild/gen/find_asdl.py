@@ -0,0 +1,935 @@
+from asdl import pybase
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class expr_e(object):
+  Concatenation = 1
+  Disjunction = 2
+  Conjunction = 3
+  Negation = 4
+  True_ = 5
+  False_ = 6
+  PathTest = 7
+  StatTest = 8
+  DeleteAction = 9
+  PruneAction = 10
+  QuitAction = 11
+  PrintAction = 12
+  LsAction = 13
+  ExecAction = 14
+
+_expr_str = {
+  1: 'expr.Concatenation',
+  2: 'expr.Disjunction',
+  3: 'expr.Conjunction',
+  4: 'expr.Negation',
+  5: 'expr.True_',
+  6: 'expr.False_',
+  7: 'expr.PathTest',
+  8: 'expr.StatTest',
+  9: 'expr.DeleteAction',
+  10: 'expr.PruneAction',
+  11: 'expr.QuitAction',
+  12: 'expr.PrintAction',
+  13: 'expr.LsAction',
+  14: 'expr.ExecAction',
+}
+
+def expr_str(tag):
+  # type: (int) -> str
+  return _expr_str[tag]
+
+class expr_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class expr__Concatenation(expr_t):
+  tag = 1
+  __slots__ = ('exprs',)
+
+  def __init__(self, exprs=None):
+    # type: (Optional[List[expr_t]]) -> None
+    self.exprs = exprs if exprs is not None else []
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Concatenation')
+    L = out_node.fields
+
+    if self.exprs:  # ArrayType
+      x0 = hnode.Array([])
+      for i0 in self.exprs:
+        x0.children.append(i0.PrettyTree())
+      L.append(field('exprs', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Concatenation')
+    L = out_node.fields
+    if self.exprs:  # ArrayType
+      x0 = hnode.Array([])
+      for i0 in self.exprs:
+        x0.children.append(i0.AbbreviatedTree())
+      L.append(field('exprs', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__Disjunction(expr_t):
+  tag = 2
+  __slots__ = ('exprs',)
+
+  def __init__(self, exprs=None):
+    # type: (Optional[List[expr_t]]) -> None
+    self.exprs = exprs if exprs is not None else []
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Disjunction')
+    L = out_node.fields
+
+    if self.exprs:  # ArrayType
+      x0 = hnode.Array([])
+      for i0 in self.exprs:
+        x0.children.append(i0.PrettyTree())
+      L.append(field('exprs', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Disjunction')
+    L = out_node.fields
+    if self.exprs:  # ArrayType
+      x0 = hnode.Array([])
+      for i0 in self.exprs:
+        x0.children.append(i0.AbbreviatedTree())
+      L.append(field('exprs', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__Conjunction(expr_t):
+  tag = 3
+  __slots__ = ('exprs',)
+
+  def __init__(self, exprs=None):
+    # type: (Optional[List[expr_t]]) -> None
+    self.exprs = exprs if exprs is not None else []
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Conjunction')
+    L = out_node.fields
+
+    if self.exprs:  # ArrayType
+      x0 = hnode.Array([])
+      for i0 in self.exprs:
+        x0.children.append(i0.PrettyTree())
+      L.append(field('exprs', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Conjunction')
+    L = out_node.fields
+    if self.exprs:  # ArrayType
+      x0 = hnode.Array([])
+      for i0 in self.exprs:
+        x0.children.append(i0.AbbreviatedTree())
+      L.append(field('exprs', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__Negation(expr_t):
+  tag = 4
+  __slots__ = ('expr',)
+
+  def __init__(self, expr=None):
+    # type: (Optional[expr_t]) -> None
+    self.expr = expr
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Negation')
+    L = out_node.fields
+
+    assert self.expr is not None
+    x0 = self.expr.PrettyTree()
+    L.append(field('expr', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Negation')
+    L = out_node.fields
+    assert self.expr is not None
+    x0 = self.expr.AbbreviatedTree()
+    L.append(field('expr', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__True_(expr_t):
+  tag = 5
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.True_')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.True_')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__False_(expr_t):
+  tag = 6
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.False_')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.False_')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__PathTest(expr_t):
+  tag = 7
+  __slots__ = ('a', 'p')
+
+  def __init__(self, a=None, p=None):
+    # type: (Optional[pathAccessor_t], Optional[predicate_t]) -> None
+    self.a = a if a is not None else pathAccessor_e.FullPath
+    self.p = p
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.PathTest')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(pathAccessor_str(self.a), color_e.TypeName)
+    L.append(field('a', x0))
+
+    assert self.p is not None
+    x1 = self.p.PrettyTree()
+    L.append(field('p', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.PathTest')
+    L = out_node.fields
+    x0 = hnode.Leaf(pathAccessor_str(self.a), color_e.TypeName)
+    L.append(field('a', x0))
+
+    assert self.p is not None
+    x1 = self.p.AbbreviatedTree()
+    L.append(field('p', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__StatTest(expr_t):
+  tag = 8
+  __slots__ = ('a', 'p')
+
+  def __init__(self, a=None, p=None):
+    # type: (Optional[statAccessor_t], Optional[predicate_t]) -> None
+    self.a = a if a is not None else statAccessor_e.AccessTime
+    self.p = p
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.StatTest')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(statAccessor_str(self.a), color_e.TypeName)
+    L.append(field('a', x0))
+
+    assert self.p is not None
+    x1 = self.p.PrettyTree()
+    L.append(field('p', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.StatTest')
+    L = out_node.fields
+    x0 = hnode.Leaf(statAccessor_str(self.a), color_e.TypeName)
+    L.append(field('a', x0))
+
+    assert self.p is not None
+    x1 = self.p.AbbreviatedTree()
+    L.append(field('p', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__DeleteAction(expr_t):
+  tag = 9
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.DeleteAction')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.DeleteAction')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__PruneAction(expr_t):
+  tag = 10
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.PruneAction')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.PruneAction')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__QuitAction(expr_t):
+  tag = 11
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.QuitAction')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.QuitAction')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__PrintAction(expr_t):
+  tag = 12
+  __slots__ = ('file', 'format')
+
+  def __init__(self, file=None, format=None):
+    # type: (Optional[str], Optional[str]) -> None
+    self.file = file if file is not None else ''
+    self.format = format if format is not None else ''
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.PrintAction')
+    L = out_node.fields
+
+    if self.file is not None:  # MaybeType
+      x0 = NewLeaf(self.file, color_e.StringConst)
+      L.append(field('file', x0))
+
+    if self.format is not None:  # MaybeType
+      x1 = NewLeaf(self.format, color_e.StringConst)
+      L.append(field('format', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.PrintAction')
+    L = out_node.fields
+    if self.file is not None:  # MaybeType
+      x0 = NewLeaf(self.file, color_e.StringConst)
+      L.append(field('file', x0))
+
+    if self.format is not None:  # MaybeType
+      x1 = NewLeaf(self.format, color_e.StringConst)
+      L.append(field('format', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__LsAction(expr_t):
+  tag = 13
+  __slots__ = ('file',)
+
+  def __init__(self, file=None):
+    # type: (Optional[str]) -> None
+    self.file = file if file is not None else ''
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.LsAction')
+    L = out_node.fields
+
+    if self.file is not None:  # MaybeType
+      x0 = NewLeaf(self.file, color_e.StringConst)
+      L.append(field('file', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.LsAction')
+    L = out_node.fields
+    if self.file is not None:  # MaybeType
+      x0 = NewLeaf(self.file, color_e.StringConst)
+      L.append(field('file', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__ExecAction(expr_t):
+  tag = 14
+  __slots__ = ('batch', 'dir', 'ok', 'argv')
+
+  def __init__(self, batch=None, dir=None, ok=None, argv=None):
+    # type: (Optional[bool], Optional[bool], Optional[bool], Optional[List[str]]) -> None
+    self.batch = batch
+    self.dir = dir
+    self.ok = ok
+    self.argv = argv if argv is not None else []
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.ExecAction')
+    L = out_node.fields
+
+    x0 = hnode.Leaf('T' if self.batch else 'F', color_e.OtherConst)
+    L.append(field('batch', x0))
+
+    x1 = hnode.Leaf('T' if self.dir else 'F', color_e.OtherConst)
+    L.append(field('dir', x1))
+
+    x2 = hnode.Leaf('T' if self.ok else 'F', color_e.OtherConst)
+    L.append(field('ok', x2))
+
+    if self.argv:  # ArrayType
+      x3 = hnode.Array([])
+      for i3 in self.argv:
+        x3.children.append(NewLeaf(i3, color_e.StringConst))
+      L.append(field('argv', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.ExecAction')
+    L = out_node.fields
+    x0 = hnode.Leaf('T' if self.batch else 'F', color_e.OtherConst)
+    L.append(field('batch', x0))
+
+    x1 = hnode.Leaf('T' if self.dir else 'F', color_e.OtherConst)
+    L.append(field('dir', x1))
+
+    x2 = hnode.Leaf('T' if self.ok else 'F', color_e.OtherConst)
+    L.append(field('ok', x2))
+
+    if self.argv:  # ArrayType
+      x3 = hnode.Array([])
+      for i3 in self.argv:
+        x3.children.append(NewLeaf(i3, color_e.StringConst))
+      L.append(field('argv', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr(object):
+  Concatenation = expr__Concatenation
+  Disjunction = expr__Disjunction
+  Conjunction = expr__Conjunction
+  Negation = expr__Negation
+  True_ = expr__True_
+  False_ = expr__False_
+  PathTest = expr__PathTest
+  StatTest = expr__StatTest
+  DeleteAction = expr__DeleteAction
+  PruneAction = expr__PruneAction
+  QuitAction = expr__QuitAction
+  PrintAction = expr__PrintAction
+  LsAction = expr__LsAction
+  ExecAction = expr__ExecAction
+
+class pathAccessor_t(pybase.SimpleObj):
+  pass
+
+class pathAccessor_e(object):
+  FullPath = pathAccessor_t(1)
+  Filename = pathAccessor_t(2)
+
+_pathAccessor_str = {
+  1: 'pathAccessor.FullPath',
+  2: 'pathAccessor.Filename',
+}
+
+def pathAccessor_str(val):
+  # type: (pathAccessor_t) -> str
+  return _pathAccessor_str[val]
+
+class statAccessor_t(pybase.SimpleObj):
+  pass
+
+class statAccessor_e(object):
+  AccessTime = statAccessor_t(1)
+  CreationTime = statAccessor_t(2)
+  ModificationTime = statAccessor_t(3)
+  Filesystem = statAccessor_t(4)
+  Inode = statAccessor_t(5)
+  LinkCount = statAccessor_t(6)
+  Mode = statAccessor_t(7)
+  Filetype = statAccessor_t(8)
+  Uid = statAccessor_t(9)
+  Gid = statAccessor_t(10)
+  Username = statAccessor_t(11)
+  Groupname = statAccessor_t(12)
+  Size = statAccessor_t(13)
+
+_statAccessor_str = {
+  1: 'statAccessor.AccessTime',
+  2: 'statAccessor.CreationTime',
+  3: 'statAccessor.ModificationTime',
+  4: 'statAccessor.Filesystem',
+  5: 'statAccessor.Inode',
+  6: 'statAccessor.LinkCount',
+  7: 'statAccessor.Mode',
+  8: 'statAccessor.Filetype',
+  9: 'statAccessor.Uid',
+  10: 'statAccessor.Gid',
+  11: 'statAccessor.Username',
+  12: 'statAccessor.Groupname',
+  13: 'statAccessor.Size',
+}
+
+def statAccessor_str(val):
+  # type: (statAccessor_t) -> str
+  return _statAccessor_str[val]
+
+class predicate_e(object):
+  EQ = 1
+  GE = 2
+  LE = 3
+  StringMatch = 4
+  GlobMatch = 5
+  RegexMatch = 6
+  Readable = 7
+  Writable = 8
+  Executable = 9
+
+_predicate_str = {
+  1: 'predicate.EQ',
+  2: 'predicate.GE',
+  3: 'predicate.LE',
+  4: 'predicate.StringMatch',
+  5: 'predicate.GlobMatch',
+  6: 'predicate.RegexMatch',
+  7: 'predicate.Readable',
+  8: 'predicate.Writable',
+  9: 'predicate.Executable',
+}
+
+def predicate_str(tag):
+  # type: (int) -> str
+  return _predicate_str[tag]
+
+class predicate_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self.tag
+  pass
+
+class predicate__EQ(predicate_t):
+  tag = 1
+  __slots__ = ('n',)
+
+  def __init__(self, n=None):
+    # type: (Optional[int]) -> None
+    self.n = n
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.EQ')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.n), color_e.OtherConst)
+    L.append(field('n', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.EQ')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.n), color_e.OtherConst)
+    L.append(field('n', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class predicate__GE(predicate_t):
+  tag = 2
+  __slots__ = ('n',)
+
+  def __init__(self, n=None):
+    # type: (Optional[int]) -> None
+    self.n = n
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.GE')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.n), color_e.OtherConst)
+    L.append(field('n', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.GE')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.n), color_e.OtherConst)
+    L.append(field('n', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class predicate__LE(predicate_t):
+  tag = 3
+  __slots__ = ('n',)
+
+  def __init__(self, n=None):
+    # type: (Optional[int]) -> None
+    self.n = n
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.LE')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.n), color_e.OtherConst)
+    L.append(field('n', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.LE')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.n), color_e.OtherConst)
+    L.append(field('n', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class predicate__StringMatch(predicate_t):
+  tag = 4
+  __slots__ = ('str', 'ignoreCase')
+
+  def __init__(self, str=None, ignoreCase=None):
+    # type: (Optional[str], Optional[bool]) -> None
+    self.str = str
+    self.ignoreCase = ignoreCase if ignoreCase is not None else None
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.StringMatch')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.str, color_e.StringConst)
+    L.append(field('str', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = hnode.Leaf('T' if self.ignoreCase else 'F', color_e.OtherConst)
+      L.append(field('ignoreCase', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.StringMatch')
+    L = out_node.fields
+    x0 = NewLeaf(self.str, color_e.StringConst)
+    L.append(field('str', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = hnode.Leaf('T' if self.ignoreCase else 'F', color_e.OtherConst)
+      L.append(field('ignoreCase', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class predicate__GlobMatch(predicate_t):
+  tag = 5
+  __slots__ = ('glob', 'ignoreCase')
+
+  def __init__(self, glob=None, ignoreCase=None):
+    # type: (Optional[str], Optional[bool]) -> None
+    self.glob = glob
+    self.ignoreCase = ignoreCase if ignoreCase is not None else None
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.GlobMatch')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.glob, color_e.StringConst)
+    L.append(field('glob', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = hnode.Leaf('T' if self.ignoreCase else 'F', color_e.OtherConst)
+      L.append(field('ignoreCase', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.GlobMatch')
+    L = out_node.fields
+    x0 = NewLeaf(self.glob, color_e.StringConst)
+    L.append(field('glob', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = hnode.Leaf('T' if self.ignoreCase else 'F', color_e.OtherConst)
+      L.append(field('ignoreCase', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class predicate__RegexMatch(predicate_t):
+  tag = 6
+  __slots__ = ('re', 'ignoreCase')
+
+  def __init__(self, re=None, ignoreCase=None):
+    # type: (Optional[str], Optional[bool]) -> None
+    self.re = re
+    self.ignoreCase = ignoreCase if ignoreCase is not None else None
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.RegexMatch')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.re, color_e.StringConst)
+    L.append(field('re', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = hnode.Leaf('T' if self.ignoreCase else 'F', color_e.OtherConst)
+      L.append(field('ignoreCase', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.RegexMatch')
+    L = out_node.fields
+    x0 = NewLeaf(self.re, color_e.StringConst)
+    L.append(field('re', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = hnode.Leaf('T' if self.ignoreCase else 'F', color_e.OtherConst)
+      L.append(field('ignoreCase', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class predicate__Readable(predicate_t):
+  tag = 7
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.Readable')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.Readable')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class predicate__Writable(predicate_t):
+  tag = 8
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.Writable')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.Writable')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class predicate__Executable(predicate_t):
+  tag = 9
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.Executable')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('predicate.Executable')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class predicate(object):
+  EQ = predicate__EQ
+  GE = predicate__GE
+  LE = predicate__LE
+  StringMatch = predicate__StringMatch
+  GlobMatch = predicate__GlobMatch
+  RegexMatch = predicate__RegexMatch
+  Readable = predicate__Readable
+  Writable = predicate__Writable
+  Executable = predicate__Executable
+
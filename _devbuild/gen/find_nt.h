@@ -0,0 +1,13 @@
+// This code is generated by pgen2/grammar.py
+
+namespace grammar_nt {
+  const int start = 256;
+  const int concatenation = 257;
+  const int conjunction = 258;
+  const int disjunction = 259;
+  const int expr = 260;
+  const int group = 261;
+  const int negation = 262;
+  const int terminator = 263;
+
+}  // namespace grammar_nt
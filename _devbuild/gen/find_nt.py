@@ -0,0 +1,10 @@
+# This code is generated by pgen2/grammar.py
+
+start = 256
+concatenation = 257
+conjunction = 258
+disjunction = 259
+expr = 260
+group = 261
+negation = 262
+terminator = 263
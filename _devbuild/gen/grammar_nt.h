@@ -0,0 +1,91 @@
+// This code is generated by pgen2/grammar.py
+
+namespace grammar_nt {
+  const int augassign = 256;
+  const int and_expr = 257;
+  const int and_test = 258;
+  const int arglist = 259;
+  const int argument = 260;
+  const int arith_expr = 261;
+  const int array_item = 262;
+  const int array_literal = 263;
+  const int atom = 264;
+  const int braced_var_sub = 265;
+  const int char_literal = 266;
+  const int class_item = 267;
+  const int class_items = 268;
+  const int class_literal = 269;
+  const int class_literal_term = 270;
+  const int command_expr = 271;
+  const int comp_for = 272;
+  const int comp_op = 273;
+  const int comparison = 274;
+  const int data_params = 275;
+  const int dict = 276;
+  const int dict_pair = 277;
+  const int dq_string = 278;
+  const int end_inner = 279;
+  const int end_outer = 280;
+  const int end_stmt = 281;
+  const int end_use = 282;
+  const int end_variant = 283;
+  const int expr = 284;
+  const int factor = 285;
+  const int func_param = 286;
+  const int func_params = 287;
+  const int inner_stmt = 288;
+  const int inner_stmts = 289;
+  const int lambdef = 290;
+  const int name_type = 291;
+  const int name_type_list = 292;
+  const int not_test = 293;
+  const int oil_arglist = 294;
+  const int oil_class = 295;
+  const int oil_data = 296;
+  const int oil_enum = 297;
+  const int oil_expr = 298;
+  const int oil_expr_sub = 299;
+  const int oil_for = 300;
+  const int oil_func = 301;
+  const int oil_place_mutation = 302;
+  const int oil_proc = 303;
+  const int oil_use = 304;
+  const int oil_var_decl = 305;
+  const int or_test = 306;
+  const int outer_stmt = 307;
+  const int place_list = 308;
+  const int power = 309;
+  const int proc_param = 310;
+  const int proc_params = 311;
+  const int range_char = 312;
+  const int range_expr = 313;
+  const int re_alt = 314;
+  const int re_atom = 315;
+  const int re_flag = 316;
+  const int re_flags = 317;
+  const int regex = 318;
+  const int repeat_op = 319;
+  const int repeat_range = 320;
+  const int sh_array_literal = 321;
+  const int sh_command_sub = 322;
+  const int shift_expr = 323;
+  const int simple_var_sub = 324;
+  const int splat_expr = 325;
+  const int sq_string = 326;
+  const int subscript = 327;
+  const int subscriptlist = 328;
+  const int tea_module = 329;
+  const int term = 330;
+  const int test = 331;
+  const int testlist = 332;
+  const int testlist_comp = 333;
+  const int trailer = 334;
+  const int type_expr = 335;
+  const int type_expr_list = 336;
+  const int use_name = 337;
+  const int use_names = 338;
+  const int variant = 339;
+  const int variant_type = 340;
+  const int xor_expr = 341;
+
+}  // namespace grammar_nt
@@ -0,0 +1,88 @@
+# This code is generated by pgen2/grammar.py
+
+augassign = 256
+and_expr = 257
+and_test = 258
+arglist = 259
+argument = 260
+arith_expr = 261
+array_item = 262
+array_literal = 263
+atom = 264
+braced_var_sub = 265
+char_literal = 266
+class_item = 267
+class_items = 268
+class_literal = 269
+class_literal_term = 270
+command_expr = 271
+comp_for = 272
+comp_op = 273
+comparison = 274
+data_params = 275
+dict = 276
+dict_pair = 277
+dq_string = 278
+end_inner = 279
+end_outer = 280
+end_stmt = 281
+end_use = 282
+end_variant = 283
+expr = 284
+factor = 285
+func_param = 286
+func_params = 287
+inner_stmt = 288
+inner_stmts = 289
+lambdef = 290
+name_type = 291
+name_type_list = 292
+not_test = 293
+oil_arglist = 294
+oil_class = 295
+oil_data = 296
+oil_enum = 297
+oil_expr = 298
+oil_expr_sub = 299
+oil_for = 300
+oil_func = 301
+oil_place_mutation = 302
+oil_proc = 303
+oil_use = 304
+oil_var_decl = 305
+or_test = 306
+outer_stmt = 307
+place_list = 308
+power = 309
+proc_param = 310
+proc_params = 311
+range_char = 312
+range_expr = 313
+re_alt = 314
+re_atom = 315
+re_flag = 316
+re_flags = 317
+regex = 318
+repeat_op = 319
+repeat_range = 320
+sh_array_literal = 321
+sh_command_sub = 322
+shift_expr = 323
+simple_var_sub = 324
+splat_expr = 325
+sq_string = 326
+subscript = 327
+subscriptlist = 328
+tea_module = 329
+term = 330
+test = 331
+testlist = 332
+testlist_comp = 333
+trailer = 334
+type_expr = 335
+type_expr_list = 336
+use_name = 337
+use_names = 338
+variant = 339
+variant_type = 340
+xor_expr = 341
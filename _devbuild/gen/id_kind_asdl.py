@@ -0,0 +1,804 @@
+from asdl import pybase
+
+Id_t = int  # type alias for integer
+
+class Id(object):
+  Word_Compound = 1
+  Arith_Semi = 2
+  Arith_Comma = 3
+  Arith_Plus = 4
+  Arith_Minus = 5
+  Arith_Star = 6
+  Arith_Slash = 7
+  Arith_Percent = 8
+  Arith_DPlus = 9
+  Arith_DMinus = 10
+  Arith_DStar = 11
+  Arith_LParen = 12
+  Arith_RParen = 13
+  Arith_LBracket = 14
+  Arith_RBracket = 15
+  Arith_RBrace = 16
+  Arith_QMark = 17
+  Arith_Colon = 18
+  Arith_LessEqual = 19
+  Arith_Less = 20
+  Arith_GreatEqual = 21
+  Arith_Great = 22
+  Arith_DEqual = 23
+  Arith_NEqual = 24
+  Arith_DAmp = 25
+  Arith_DPipe = 26
+  Arith_Bang = 27
+  Arith_DGreat = 28
+  Arith_DLess = 29
+  Arith_Amp = 30
+  Arith_Pipe = 31
+  Arith_Caret = 32
+  Arith_Tilde = 33
+  Arith_Equal = 34
+  Arith_PlusEqual = 35
+  Arith_MinusEqual = 36
+  Arith_StarEqual = 37
+  Arith_SlashEqual = 38
+  Arith_PercentEqual = 39
+  Arith_DGreatEqual = 40
+  Arith_DLessEqual = 41
+  Arith_AmpEqual = 42
+  Arith_PipeEqual = 43
+  Arith_CaretEqual = 44
+  Eof_Real = 45
+  Eof_RParen = 46
+  Eof_Backtick = 47
+  Undefined_Tok = 48
+  Unknown_Tok = 49
+  Eol_Tok = 50
+  Ignored_LineCont = 51
+  Ignored_Space = 52
+  Ignored_Comment = 53
+  WS_Space = 54
+  Lit_Chars = 55
+  Lit_VarLike = 56
+  Lit_ArrayLhsOpen = 57
+  Lit_ArrayLhsClose = 58
+  Lit_Splice = 59
+  Lit_Other = 60
+  Lit_EscapedChar = 61
+  Lit_RegexMeta = 62
+  Lit_LBracket = 63
+  Lit_RBracket = 64
+  Lit_Star = 65
+  Lit_QMark = 66
+  Lit_LBrace = 67
+  Lit_RBrace = 68
+  Lit_Comma = 69
+  Lit_Equals = 70
+  Lit_DRightBracket = 71
+  Lit_TildeLike = 72
+  Lit_Pound = 73
+  Lit_Slash = 74
+  Lit_Percent = 75
+  Lit_Digits = 76
+  Lit_At = 77
+  Lit_ArithVarLike = 78
+  Lit_CompDummy = 79
+  Backtick_Right = 80
+  Backtick_Quoted = 81
+  Backtick_Other = 82
+  History_Op = 83
+  History_Num = 84
+  History_Search = 85
+  History_Other = 86
+  Op_Newline = 87
+  Op_Amp = 88
+  Op_Pipe = 89
+  Op_PipeAmp = 90
+  Op_DAmp = 91
+  Op_DPipe = 92
+  Op_Semi = 93
+  Op_DSemi = 94
+  Op_LParen = 95
+  Op_RParen = 96
+  Op_DLeftParen = 97
+  Op_DRightParen = 98
+  Op_Less = 99
+  Op_Great = 100
+  Op_Bang = 101
+  Op_LBracket = 102
+  Op_RBracket = 103
+  Op_LBrace = 104
+  Op_RBrace = 105
+  Expr_Reserved = 106
+  Expr_Symbol = 107
+  Expr_Name = 108
+  Expr_DecInt = 109
+  Expr_BinInt = 110
+  Expr_OctInt = 111
+  Expr_HexInt = 112
+  Expr_Float = 113
+  Expr_Dot = 114
+  Expr_DColon = 115
+  Expr_RArrow = 116
+  Expr_RDArrow = 117
+  Expr_At = 118
+  Expr_DoubleAt = 119
+  Expr_Ellipsis = 120
+  Expr_Dollar = 121
+  Expr_NotTilde = 122
+  Expr_CastedDummy = 123
+  Expr_Null = 124
+  Expr_True = 125
+  Expr_False = 126
+  Expr_Div = 127
+  Expr_Mod = 128
+  Expr_Xor = 129
+  Expr_And = 130
+  Expr_Or = 131
+  Expr_Not = 132
+  Expr_For = 133
+  Expr_Is = 134
+  Expr_In = 135
+  Expr_If = 136
+  Expr_Else = 137
+  Expr_Func = 138
+  Expr_As = 139
+  Expr_Virtual = 140
+  Expr_Override = 141
+  Expr_Abstract = 142
+  Char_OneChar = 143
+  Char_Stop = 144
+  Char_Hex = 145
+  Char_Octal3 = 146
+  Char_Octal4 = 147
+  Char_Unicode4 = 148
+  Char_Unicode8 = 149
+  Char_Literals = 150
+  Char_BadBackslash = 151
+  Re_Start = 152
+  Re_End = 153
+  Re_Dot = 154
+  Redir_Less = 155
+  Redir_Great = 156
+  Redir_DLess = 157
+  Redir_TLess = 158
+  Redir_DGreat = 159
+  Redir_GreatAnd = 160
+  Redir_LessAnd = 161
+  Redir_DLessDash = 162
+  Redir_LessGreat = 163
+  Redir_Clobber = 164
+  Redir_AndGreat = 165
+  Redir_AndDGreat = 166
+  Redir_GreatPlus = 167
+  Redir_DGreatPlus = 168
+  Left_DoubleQuote = 169
+  Left_SingleQuoteRaw = 170
+  Left_SingleQuoteC = 171
+  Left_Backtick = 172
+  Left_DollarParen = 173
+  Left_DollarBrace = 174
+  Left_DollarDParen = 175
+  Left_DollarBracket = 176
+  Left_DollarDoubleQuote = 177
+  Left_ProcSubIn = 178
+  Left_ProcSubOut = 179
+  Left_AtBrace = 180
+  Left_AtBracket = 181
+  Left_AtParen = 182
+  Right_DoubleQuote = 183
+  Right_SingleQuote = 184
+  Right_Backtick = 185
+  Right_DollarBrace = 186
+  Right_DollarDParen = 187
+  Right_DollarDoubleQuote = 188
+  Right_DollarSingleQuote = 189
+  Right_Subshell = 190
+  Right_ShFunction = 191
+  Right_CasePat = 192
+  Right_ShArrayLiteral = 193
+  Right_ExtGlob = 194
+  ExtGlob_At = 195
+  ExtGlob_Star = 196
+  ExtGlob_Plus = 197
+  ExtGlob_QMark = 198
+  ExtGlob_Bang = 199
+  VSub_DollarName = 200
+  VSub_Name = 201
+  VSub_Number = 202
+  VSub_Bang = 203
+  VSub_At = 204
+  VSub_Pound = 205
+  VSub_Dollar = 206
+  VSub_Star = 207
+  VSub_Hyphen = 208
+  VSub_QMark = 209
+  VTest_ColonHyphen = 210
+  VTest_Hyphen = 211
+  VTest_ColonEquals = 212
+  VTest_Equals = 213
+  VTest_ColonQMark = 214
+  VTest_QMark = 215
+  VTest_ColonPlus = 216
+  VTest_Plus = 217
+  VOp0_Q = 218
+  VOp0_E = 219
+  VOp0_P = 220
+  VOp0_A = 221
+  VOp0_a = 222
+  VOp1_Percent = 223
+  VOp1_DPercent = 224
+  VOp1_Pound = 225
+  VOp1_DPound = 226
+  VOp1_Caret = 227
+  VOp1_DCaret = 228
+  VOp1_Comma = 229
+  VOp1_DComma = 230
+  VOp2_Slash = 231
+  VOp2_Colon = 232
+  VOp2_LBracket = 233
+  VOp2_RBracket = 234
+  VOp3_At = 235
+  VOp3_Star = 236
+  Node_PostDPlus = 237
+  Node_PostDMinus = 238
+  Node_UnaryPlus = 239
+  Node_UnaryMinus = 240
+  Node_NotIn = 241
+  Node_IsNot = 242
+  KW_DLeftBracket = 243
+  KW_Bang = 244
+  KW_For = 245
+  KW_While = 246
+  KW_Until = 247
+  KW_Do = 248
+  KW_Done = 249
+  KW_In = 250
+  KW_Case = 251
+  KW_Esac = 252
+  KW_If = 253
+  KW_Fi = 254
+  KW_Then = 255
+  KW_Else = 256
+  KW_Elif = 257
+  KW_Function = 258
+  KW_Time = 259
+  KW_Const = 260
+  KW_Var = 261
+  KW_SetVar = 262
+  KW_SetRef = 263
+  KW_Set = 264
+  KW_SetLocal = 265
+  KW_SetGlobal = 266
+  KW_Proc = 267
+  KW_Func = 268
+  KW_Data = 269
+  KW_Enum = 270
+  KW_Class = 271
+  KW_Use = 272
+  KW_Pass = 273
+  ControlFlow_Break = 274
+  ControlFlow_Continue = 275
+  ControlFlow_Return = 276
+  ControlFlow_Exit = 277
+  Glob_LBracket = 278
+  Glob_RBracket = 279
+  Glob_Star = 280
+  Glob_QMark = 281
+  Glob_Bang = 282
+  Glob_Caret = 283
+  Glob_EscapedChar = 284
+  Glob_BadBackslash = 285
+  Glob_CleanLiterals = 286
+  Glob_OtherLiteral = 287
+  Format_EscapedPercent = 288
+  Format_Percent = 289
+  Format_Flag = 290
+  Format_Num = 291
+  Format_Dot = 292
+  Format_Type = 293
+  Format_Star = 294
+  Format_Time = 295
+  Format_Zero = 296
+  PS_Subst = 297
+  PS_Octal3 = 298
+  PS_LBrace = 299
+  PS_RBrace = 300
+  PS_Literals = 301
+  PS_BadBackslash = 302
+  Range_Int = 303
+  Range_Char = 304
+  Range_Dots = 305
+  Range_Other = 306
+  QSN_LiteralBytes = 307
+  QSN_SpecialByte = 308
+  QSN_Begin2 = 309
+  QSN_Begin3 = 310
+  QSN_Begin4 = 311
+  QSN_Cont = 312
+  BoolUnary_z = 313
+  BoolUnary_n = 314
+  BoolUnary_o = 315
+  BoolUnary_t = 316
+  BoolUnary_v = 317
+  BoolUnary_R = 318
+  BoolUnary_a = 319
+  BoolUnary_b = 320
+  BoolUnary_c = 321
+  BoolUnary_d = 322
+  BoolUnary_e = 323
+  BoolUnary_f = 324
+  BoolUnary_g = 325
+  BoolUnary_h = 326
+  BoolUnary_k = 327
+  BoolUnary_L = 328
+  BoolUnary_p = 329
+  BoolUnary_r = 330
+  BoolUnary_s = 331
+  BoolUnary_S = 332
+  BoolUnary_u = 333
+  BoolUnary_w = 334
+  BoolUnary_x = 335
+  BoolUnary_O = 336
+  BoolUnary_G = 337
+  BoolUnary_N = 338
+  BoolBinary_GlobEqual = 339
+  BoolBinary_GlobDEqual = 340
+  BoolBinary_GlobNEqual = 341
+  BoolBinary_EqualTilde = 342
+  BoolBinary_ef = 343
+  BoolBinary_nt = 344
+  BoolBinary_ot = 345
+  BoolBinary_eq = 346
+  BoolBinary_ne = 347
+  BoolBinary_gt = 348
+  BoolBinary_ge = 349
+  BoolBinary_lt = 350
+  BoolBinary_le = 351
+  BoolBinary_Equal = 352
+  BoolBinary_DEqual = 353
+  BoolBinary_NEqual = 354
+  ARRAY_SIZE = 355
+
+_Id_str = {
+  1: 'Id.Word_Compound',
+  2: 'Id.Arith_Semi',
+  3: 'Id.Arith_Comma',
+  4: 'Id.Arith_Plus',
+  5: 'Id.Arith_Minus',
+  6: 'Id.Arith_Star',
+  7: 'Id.Arith_Slash',
+  8: 'Id.Arith_Percent',
+  9: 'Id.Arith_DPlus',
+  10: 'Id.Arith_DMinus',
+  11: 'Id.Arith_DStar',
+  12: 'Id.Arith_LParen',
+  13: 'Id.Arith_RParen',
+  14: 'Id.Arith_LBracket',
+  15: 'Id.Arith_RBracket',
+  16: 'Id.Arith_RBrace',
+  17: 'Id.Arith_QMark',
+  18: 'Id.Arith_Colon',
+  19: 'Id.Arith_LessEqual',
+  20: 'Id.Arith_Less',
+  21: 'Id.Arith_GreatEqual',
+  22: 'Id.Arith_Great',
+  23: 'Id.Arith_DEqual',
+  24: 'Id.Arith_NEqual',
+  25: 'Id.Arith_DAmp',
+  26: 'Id.Arith_DPipe',
+  27: 'Id.Arith_Bang',
+  28: 'Id.Arith_DGreat',
+  29: 'Id.Arith_DLess',
+  30: 'Id.Arith_Amp',
+  31: 'Id.Arith_Pipe',
+  32: 'Id.Arith_Caret',
+  33: 'Id.Arith_Tilde',
+  34: 'Id.Arith_Equal',
+  35: 'Id.Arith_PlusEqual',
+  36: 'Id.Arith_MinusEqual',
+  37: 'Id.Arith_StarEqual',
+  38: 'Id.Arith_SlashEqual',
+  39: 'Id.Arith_PercentEqual',
+  40: 'Id.Arith_DGreatEqual',
+  41: 'Id.Arith_DLessEqual',
+  42: 'Id.Arith_AmpEqual',
+  43: 'Id.Arith_PipeEqual',
+  44: 'Id.Arith_CaretEqual',
+  45: 'Id.Eof_Real',
+  46: 'Id.Eof_RParen',
+  47: 'Id.Eof_Backtick',
+  48: 'Id.Undefined_Tok',
+  49: 'Id.Unknown_Tok',
+  50: 'Id.Eol_Tok',
+  51: 'Id.Ignored_LineCont',
+  52: 'Id.Ignored_Space',
+  53: 'Id.Ignored_Comment',
+  54: 'Id.WS_Space',
+  55: 'Id.Lit_Chars',
+  56: 'Id.Lit_VarLike',
+  57: 'Id.Lit_ArrayLhsOpen',
+  58: 'Id.Lit_ArrayLhsClose',
+  59: 'Id.Lit_Splice',
+  60: 'Id.Lit_Other',
+  61: 'Id.Lit_EscapedChar',
+  62: 'Id.Lit_RegexMeta',
+  63: 'Id.Lit_LBracket',
+  64: 'Id.Lit_RBracket',
+  65: 'Id.Lit_Star',
+  66: 'Id.Lit_QMark',
+  67: 'Id.Lit_LBrace',
+  68: 'Id.Lit_RBrace',
+  69: 'Id.Lit_Comma',
+  70: 'Id.Lit_Equals',
+  71: 'Id.Lit_DRightBracket',
+  72: 'Id.Lit_TildeLike',
+  73: 'Id.Lit_Pound',
+  74: 'Id.Lit_Slash',
+  75: 'Id.Lit_Percent',
+  76: 'Id.Lit_Digits',
+  77: 'Id.Lit_At',
+  78: 'Id.Lit_ArithVarLike',
+  79: 'Id.Lit_CompDummy',
+  80: 'Id.Backtick_Right',
+  81: 'Id.Backtick_Quoted',
+  82: 'Id.Backtick_Other',
+  83: 'Id.History_Op',
+  84: 'Id.History_Num',
+  85: 'Id.History_Search',
+  86: 'Id.History_Other',
+  87: 'Id.Op_Newline',
+  88: 'Id.Op_Amp',
+  89: 'Id.Op_Pipe',
+  90: 'Id.Op_PipeAmp',
+  91: 'Id.Op_DAmp',
+  92: 'Id.Op_DPipe',
+  93: 'Id.Op_Semi',
+  94: 'Id.Op_DSemi',
+  95: 'Id.Op_LParen',
+  96: 'Id.Op_RParen',
+  97: 'Id.Op_DLeftParen',
+  98: 'Id.Op_DRightParen',
+  99: 'Id.Op_Less',
+  100: 'Id.Op_Great',
+  101: 'Id.Op_Bang',
+  102: 'Id.Op_LBracket',
+  103: 'Id.Op_RBracket',
+  104: 'Id.Op_LBrace',
+  105: 'Id.Op_RBrace',
+  106: 'Id.Expr_Reserved',
+  107: 'Id.Expr_Symbol',
+  108: 'Id.Expr_Name',
+  109: 'Id.Expr_DecInt',
+  110: 'Id.Expr_BinInt',
+  111: 'Id.Expr_OctInt',
+  112: 'Id.Expr_HexInt',
+  113: 'Id.Expr_Float',
+  114: 'Id.Expr_Dot',
+  115: 'Id.Expr_DColon',
+  116: 'Id.Expr_RArrow',
+  117: 'Id.Expr_RDArrow',
+  118: 'Id.Expr_At',
+  119: 'Id.Expr_DoubleAt',
+  120: 'Id.Expr_Ellipsis',
+  121: 'Id.Expr_Dollar',
+  122: 'Id.Expr_NotTilde',
+  123: 'Id.Expr_CastedDummy',
+  124: 'Id.Expr_Null',
+  125: 'Id.Expr_True',
+  126: 'Id.Expr_False',
+  127: 'Id.Expr_Div',
+  128: 'Id.Expr_Mod',
+  129: 'Id.Expr_Xor',
+  130: 'Id.Expr_And',
+  131: 'Id.Expr_Or',
+  132: 'Id.Expr_Not',
+  133: 'Id.Expr_For',
+  134: 'Id.Expr_Is',
+  135: 'Id.Expr_In',
+  136: 'Id.Expr_If',
+  137: 'Id.Expr_Else',
+  138: 'Id.Expr_Func',
+  139: 'Id.Expr_As',
+  140: 'Id.Expr_Virtual',
+  141: 'Id.Expr_Override',
+  142: 'Id.Expr_Abstract',
+  143: 'Id.Char_OneChar',
+  144: 'Id.Char_Stop',
+  145: 'Id.Char_Hex',
+  146: 'Id.Char_Octal3',
+  147: 'Id.Char_Octal4',
+  148: 'Id.Char_Unicode4',
+  149: 'Id.Char_Unicode8',
+  150: 'Id.Char_Literals',
+  151: 'Id.Char_BadBackslash',
+  152: 'Id.Re_Start',
+  153: 'Id.Re_End',
+  154: 'Id.Re_Dot',
+  155: 'Id.Redir_Less',
+  156: 'Id.Redir_Great',
+  157: 'Id.Redir_DLess',
+  158: 'Id.Redir_TLess',
+  159: 'Id.Redir_DGreat',
+  160: 'Id.Redir_GreatAnd',
+  161: 'Id.Redir_LessAnd',
+  162: 'Id.Redir_DLessDash',
+  163: 'Id.Redir_LessGreat',
+  164: 'Id.Redir_Clobber',
+  165: 'Id.Redir_AndGreat',
+  166: 'Id.Redir_AndDGreat',
+  167: 'Id.Redir_GreatPlus',
+  168: 'Id.Redir_DGreatPlus',
+  169: 'Id.Left_DoubleQuote',
+  170: 'Id.Left_SingleQuoteRaw',
+  171: 'Id.Left_SingleQuoteC',
+  172: 'Id.Left_Backtick',
+  173: 'Id.Left_DollarParen',
+  174: 'Id.Left_DollarBrace',
+  175: 'Id.Left_DollarDParen',
+  176: 'Id.Left_DollarBracket',
+  177: 'Id.Left_DollarDoubleQuote',
+  178: 'Id.Left_ProcSubIn',
+  179: 'Id.Left_ProcSubOut',
+  180: 'Id.Left_AtBrace',
+  181: 'Id.Left_AtBracket',
+  182: 'Id.Left_AtParen',
+  183: 'Id.Right_DoubleQuote',
+  184: 'Id.Right_SingleQuote',
+  185: 'Id.Right_Backtick',
+  186: 'Id.Right_DollarBrace',
+  187: 'Id.Right_DollarDParen',
+  188: 'Id.Right_DollarDoubleQuote',
+  189: 'Id.Right_DollarSingleQuote',
+  190: 'Id.Right_Subshell',
+  191: 'Id.Right_ShFunction',
+  192: 'Id.Right_CasePat',
+  193: 'Id.Right_ShArrayLiteral',
+  194: 'Id.Right_ExtGlob',
+  195: 'Id.ExtGlob_At',
+  196: 'Id.ExtGlob_Star',
+  197: 'Id.ExtGlob_Plus',
+  198: 'Id.ExtGlob_QMark',
+  199: 'Id.ExtGlob_Bang',
+  200: 'Id.VSub_DollarName',
+  201: 'Id.VSub_Name',
+  202: 'Id.VSub_Number',
+  203: 'Id.VSub_Bang',
+  204: 'Id.VSub_At',
+  205: 'Id.VSub_Pound',
+  206: 'Id.VSub_Dollar',
+  207: 'Id.VSub_Star',
+  208: 'Id.VSub_Hyphen',
+  209: 'Id.VSub_QMark',
+  210: 'Id.VTest_ColonHyphen',
+  211: 'Id.VTest_Hyphen',
+  212: 'Id.VTest_ColonEquals',
+  213: 'Id.VTest_Equals',
+  214: 'Id.VTest_ColonQMark',
+  215: 'Id.VTest_QMark',
+  216: 'Id.VTest_ColonPlus',
+  217: 'Id.VTest_Plus',
+  218: 'Id.VOp0_Q',
+  219: 'Id.VOp0_E',
+  220: 'Id.VOp0_P',
+  221: 'Id.VOp0_A',
+  222: 'Id.VOp0_a',
+  223: 'Id.VOp1_Percent',
+  224: 'Id.VOp1_DPercent',
+  225: 'Id.VOp1_Pound',
+  226: 'Id.VOp1_DPound',
+  227: 'Id.VOp1_Caret',
+  228: 'Id.VOp1_DCaret',
+  229: 'Id.VOp1_Comma',
+  230: 'Id.VOp1_DComma',
+  231: 'Id.VOp2_Slash',
+  232: 'Id.VOp2_Colon',
+  233: 'Id.VOp2_LBracket',
+  234: 'Id.VOp2_RBracket',
+  235: 'Id.VOp3_At',
+  236: 'Id.VOp3_Star',
+  237: 'Id.Node_PostDPlus',
+  238: 'Id.Node_PostDMinus',
+  239: 'Id.Node_UnaryPlus',
+  240: 'Id.Node_UnaryMinus',
+  241: 'Id.Node_NotIn',
+  242: 'Id.Node_IsNot',
+  243: 'Id.KW_DLeftBracket',
+  244: 'Id.KW_Bang',
+  245: 'Id.KW_For',
+  246: 'Id.KW_While',
+  247: 'Id.KW_Until',
+  248: 'Id.KW_Do',
+  249: 'Id.KW_Done',
+  250: 'Id.KW_In',
+  251: 'Id.KW_Case',
+  252: 'Id.KW_Esac',
+  253: 'Id.KW_If',
+  254: 'Id.KW_Fi',
+  255: 'Id.KW_Then',
+  256: 'Id.KW_Else',
+  257: 'Id.KW_Elif',
+  258: 'Id.KW_Function',
+  259: 'Id.KW_Time',
+  260: 'Id.KW_Const',
+  261: 'Id.KW_Var',
+  262: 'Id.KW_SetVar',
+  263: 'Id.KW_SetRef',
+  264: 'Id.KW_Set',
+  265: 'Id.KW_SetLocal',
+  266: 'Id.KW_SetGlobal',
+  267: 'Id.KW_Proc',
+  268: 'Id.KW_Func',
+  269: 'Id.KW_Data',
+  270: 'Id.KW_Enum',
+  271: 'Id.KW_Class',
+  272: 'Id.KW_Use',
+  273: 'Id.KW_Pass',
+  274: 'Id.ControlFlow_Break',
+  275: 'Id.ControlFlow_Continue',
+  276: 'Id.ControlFlow_Return',
+  277: 'Id.ControlFlow_Exit',
+  278: 'Id.Glob_LBracket',
+  279: 'Id.Glob_RBracket',
+  280: 'Id.Glob_Star',
+  281: 'Id.Glob_QMark',
+  282: 'Id.Glob_Bang',
+  283: 'Id.Glob_Caret',
+  284: 'Id.Glob_EscapedChar',
+  285: 'Id.Glob_BadBackslash',
+  286: 'Id.Glob_CleanLiterals',
+  287: 'Id.Glob_OtherLiteral',
+  288: 'Id.Format_EscapedPercent',
+  289: 'Id.Format_Percent',
+  290: 'Id.Format_Flag',
+  291: 'Id.Format_Num',
+  292: 'Id.Format_Dot',
+  293: 'Id.Format_Type',
+  294: 'Id.Format_Star',
+  295: 'Id.Format_Time',
+  296: 'Id.Format_Zero',
+  297: 'Id.PS_Subst',
+  298: 'Id.PS_Octal3',
+  299: 'Id.PS_LBrace',
+  300: 'Id.PS_RBrace',
+  301: 'Id.PS_Literals',
+  302: 'Id.PS_BadBackslash',
+  303: 'Id.Range_Int',
+  304: 'Id.Range_Char',
+  305: 'Id.Range_Dots',
+  306: 'Id.Range_Other',
+  307: 'Id.QSN_LiteralBytes',
+  308: 'Id.QSN_SpecialByte',
+  309: 'Id.QSN_Begin2',
+  310: 'Id.QSN_Begin3',
+  311: 'Id.QSN_Begin4',
+  312: 'Id.QSN_Cont',
+  313: 'Id.BoolUnary_z',
+  314: 'Id.BoolUnary_n',
+  315: 'Id.BoolUnary_o',
+  316: 'Id.BoolUnary_t',
+  317: 'Id.BoolUnary_v',
+  318: 'Id.BoolUnary_R',
+  319: 'Id.BoolUnary_a',
+  320: 'Id.BoolUnary_b',
+  321: 'Id.BoolUnary_c',
+  322: 'Id.BoolUnary_d',
+  323: 'Id.BoolUnary_e',
+  324: 'Id.BoolUnary_f',
+  325: 'Id.BoolUnary_g',
+  326: 'Id.BoolUnary_h',
+  327: 'Id.BoolUnary_k',
+  328: 'Id.BoolUnary_L',
+  329: 'Id.BoolUnary_p',
+  330: 'Id.BoolUnary_r',
+  331: 'Id.BoolUnary_s',
+  332: 'Id.BoolUnary_S',
+  333: 'Id.BoolUnary_u',
+  334: 'Id.BoolUnary_w',
+  335: 'Id.BoolUnary_x',
+  336: 'Id.BoolUnary_O',
+  337: 'Id.BoolUnary_G',
+  338: 'Id.BoolUnary_N',
+  339: 'Id.BoolBinary_GlobEqual',
+  340: 'Id.BoolBinary_GlobDEqual',
+  341: 'Id.BoolBinary_GlobNEqual',
+  342: 'Id.BoolBinary_EqualTilde',
+  343: 'Id.BoolBinary_ef',
+  344: 'Id.BoolBinary_nt',
+  345: 'Id.BoolBinary_ot',
+  346: 'Id.BoolBinary_eq',
+  347: 'Id.BoolBinary_ne',
+  348: 'Id.BoolBinary_gt',
+  349: 'Id.BoolBinary_ge',
+  350: 'Id.BoolBinary_lt',
+  351: 'Id.BoolBinary_le',
+  352: 'Id.BoolBinary_Equal',
+  353: 'Id.BoolBinary_DEqual',
+  354: 'Id.BoolBinary_NEqual',
+}
+
+def Id_str(val):
+  # type: (Id_t) -> str
+  return _Id_str[val]
+
+class Kind_t(pybase.SimpleObj):
+  pass
+
+class Kind(object):
+  Word = Kind_t(1)
+  Arith = Kind_t(2)
+  Eof = Kind_t(3)
+  Undefined = Kind_t(4)
+  Unknown = Kind_t(5)
+  Eol = Kind_t(6)
+  Ignored = Kind_t(7)
+  WS = Kind_t(8)
+  Lit = Kind_t(9)
+  Backtick = Kind_t(10)
+  History = Kind_t(11)
+  Op = Kind_t(12)
+  Expr = Kind_t(13)
+  Char = Kind_t(14)
+  Re = Kind_t(15)
+  Redir = Kind_t(16)
+  Left = Kind_t(17)
+  Right = Kind_t(18)
+  ExtGlob = Kind_t(19)
+  VSub = Kind_t(20)
+  VTest = Kind_t(21)
+  VOp0 = Kind_t(22)
+  VOp1 = Kind_t(23)
+  VOp2 = Kind_t(24)
+  VOp3 = Kind_t(25)
+  Node = Kind_t(26)
+  KW = Kind_t(27)
+  ControlFlow = Kind_t(28)
+  Glob = Kind_t(29)
+  Format = Kind_t(30)
+  PS = Kind_t(31)
+  Range = Kind_t(32)
+  QSN = Kind_t(33)
+  BoolUnary = Kind_t(34)
+  BoolBinary = Kind_t(35)
+
+_Kind_str = {
+  1: 'Kind.Word',
+  2: 'Kind.Arith',
+  3: 'Kind.Eof',
+  4: 'Kind.Undefined',
+  5: 'Kind.Unknown',
+  6: 'Kind.Eol',
+  7: 'Kind.Ignored',
+  8: 'Kind.WS',
+  9: 'Kind.Lit',
+  10: 'Kind.Backtick',
+  11: 'Kind.History',
+  12: 'Kind.Op',
+  13: 'Kind.Expr',
+  14: 'Kind.Char',
+  15: 'Kind.Re',
+  16: 'Kind.Redir',
+  17: 'Kind.Left',
+  18: 'Kind.Right',
+  19: 'Kind.ExtGlob',
+  20: 'Kind.VSub',
+  21: 'Kind.VTest',
+  22: 'Kind.VOp0',
+  23: 'Kind.VOp1',
+  24: 'Kind.VOp2',
+  25: 'Kind.VOp3',
+  26: 'Kind.Node',
+  27: 'Kind.KW',
+  28: 'Kind.ControlFlow',
+  29: 'Kind.Glob',
+  30: 'Kind.Format',
+  31: 'Kind.PS',
+  32: 'Kind.Range',
+  33: 'Kind.QSN',
+  34: 'Kind.BoolUnary',
+  35: 'Kind.BoolBinary',
+}
+
+def Kind_str(val):
+  # type: (Kind_t) -> str
+  return _Kind_str[val]
+
@@ -0,0 +1,316 @@
+from asdl import pybase
+
+option_t = int  # type alias for integer
+
+class option_i(object):
+  errexit = 1
+  nounset = 2
+  hashall = 3
+  pipefail = 4
+  noexec = 5
+  xtrace = 6
+  verbose = 7
+  noglob = 8
+  noclobber = 9
+  posix = 10
+  vi = 11
+  emacs = 12
+  interactive = 13
+  failglob = 14
+  extglob = 15
+  globstar = 16
+  dotglob = 17
+  nocaseglob = 18
+  eval_unsafe_arith = 19
+  parse_dynamic_arith = 20
+  compat_array = 21
+  verbose_errexit = 22
+  nullglob = 23
+  inherit_errexit = 24
+  strict_argv = 25
+  strict_arith = 26
+  strict_array = 27
+  strict_control_flow = 28
+  strict_echo = 29
+  strict_errexit = 30
+  strict_eval_builtin = 31
+  strict_nameref = 32
+  strict_word_eval = 33
+  strict_backslash = 34
+  strict_glob = 35
+  simple_word_eval = 36
+  dashglob = 37
+  more_errexit = 38
+  simple_test_builtin = 39
+  parse_at = 40
+  parse_brace = 41
+  parse_index_expr = 42
+  parse_paren = 43
+  parse_rawc = 44
+  parse_ignored = 45
+  parse_set = 46
+  parse_equals = 47
+  parse_tea = 48
+  expand_aliases = 49
+  lastpipe = 50
+  progcomp = 51
+  histappend = 52
+  hostcomplete = 53
+  cmdhist = 54
+  assoc_expand_once = 55
+  autocd = 56
+  cdable_vars = 57
+  cdspell = 58
+  checkhash = 59
+  checkjobs = 60
+  checkwinsize = 61
+  complete_fullquote = 62
+  direxpand = 63
+  dirspell = 64
+  execfail = 65
+  extdebug = 66
+  extquote = 67
+  force_fignore = 68
+  globasciiranges = 69
+  gnu_errfmt = 70
+  histreedit = 71
+  histverify = 72
+  huponexit = 73
+  interactive_comments = 74
+  lithist = 75
+  localvar_inherit = 76
+  localvar_unset = 77
+  login_shell = 78
+  mailwarn = 79
+  no_empty_cmd_completion = 80
+  nocasematch = 81
+  progcomp_alias = 82
+  promptvars = 83
+  restricted_shell = 84
+  shift_verbose = 85
+  sourcepath = 86
+  xpg_echo = 87
+  ARRAY_SIZE = 88
+
+_option_str = {
+  1: 'option.errexit',
+  2: 'option.nounset',
+  3: 'option.hashall',
+  4: 'option.pipefail',
+  5: 'option.noexec',
+  6: 'option.xtrace',
+  7: 'option.verbose',
+  8: 'option.noglob',
+  9: 'option.noclobber',
+  10: 'option.posix',
+  11: 'option.vi',
+  12: 'option.emacs',
+  13: 'option.interactive',
+  14: 'option.failglob',
+  15: 'option.extglob',
+  16: 'option.globstar',
+  17: 'option.dotglob',
+  18: 'option.nocaseglob',
+  19: 'option.eval_unsafe_arith',
+  20: 'option.parse_dynamic_arith',
+  21: 'option.compat_array',
+  22: 'option.verbose_errexit',
+  23: 'option.nullglob',
+  24: 'option.inherit_errexit',
+  25: 'option.strict_argv',
+  26: 'option.strict_arith',
+  27: 'option.strict_array',
+  28: 'option.strict_control_flow',
+  29: 'option.strict_echo',
+  30: 'option.strict_errexit',
+  31: 'option.strict_eval_builtin',
+  32: 'option.strict_nameref',
+  33: 'option.strict_word_eval',
+  34: 'option.strict_backslash',
+  35: 'option.strict_glob',
+  36: 'option.simple_word_eval',
+  37: 'option.dashglob',
+  38: 'option.more_errexit',
+  39: 'option.simple_test_builtin',
+  40: 'option.parse_at',
+  41: 'option.parse_brace',
+  42: 'option.parse_index_expr',
+  43: 'option.parse_paren',
+  44: 'option.parse_rawc',
+  45: 'option.parse_ignored',
+  46: 'option.parse_set',
+  47: 'option.parse_equals',
+  48: 'option.parse_tea',
+  49: 'option.expand_aliases',
+  50: 'option.lastpipe',
+  51: 'option.progcomp',
+  52: 'option.histappend',
+  53: 'option.hostcomplete',
+  54: 'option.cmdhist',
+  55: 'option.assoc_expand_once',
+  56: 'option.autocd',
+  57: 'option.cdable_vars',
+  58: 'option.cdspell',
+  59: 'option.checkhash',
+  60: 'option.checkjobs',
+  61: 'option.checkwinsize',
+  62: 'option.complete_fullquote',
+  63: 'option.direxpand',
+  64: 'option.dirspell',
+  65: 'option.execfail',
+  66: 'option.extdebug',
+  67: 'option.extquote',
+  68: 'option.force_fignore',
+  69: 'option.globasciiranges',
+  70: 'option.gnu_errfmt',
+  71: 'option.histreedit',
+  72: 'option.histverify',
+  73: 'option.huponexit',
+  74: 'option.interactive_comments',
+  75: 'option.lithist',
+  76: 'option.localvar_inherit',
+  77: 'option.localvar_unset',
+  78: 'option.login_shell',
+  79: 'option.mailwarn',
+  80: 'option.no_empty_cmd_completion',
+  81: 'option.nocasematch',
+  82: 'option.progcomp_alias',
+  83: 'option.promptvars',
+  84: 'option.restricted_shell',
+  85: 'option.shift_verbose',
+  86: 'option.sourcepath',
+  87: 'option.xpg_echo',
+}
+
+def option_str(val):
+  # type: (option_t) -> str
+  return _option_str[val]
+
+builtin_t = int  # type alias for integer
+
+class builtin_i(object):
+  colon = 1
+  dot = 2
+  exec_ = 3
+  eval = 4
+  set = 5
+  shift = 6
+  times = 7
+  trap = 8
+  unset = 9
+  builtin = 10
+  readonly = 11
+  local = 12
+  declare = 13
+  typeset = 14
+  export_ = 15
+  test = 16
+  bracket = 17
+  true_ = 18
+  false_ = 19
+  read = 20
+  echo = 21
+  printf = 22
+  mapfile = 23
+  readarray = 24
+  cd = 25
+  pushd = 26
+  popd = 27
+  dirs = 28
+  pwd = 29
+  source = 30
+  umask = 31
+  wait = 32
+  each = 33
+  jobs = 34
+  fg = 35
+  bg = 36
+  shopt = 37
+  complete = 38
+  compgen = 39
+  compopt = 40
+  compadjust = 41
+  getopts = 42
+  command = 43
+  type = 44
+  hash = 45
+  help = 46
+  history = 47
+  alias = 48
+  unalias = 49
+  bind = 50
+  push = 51
+  append = 52
+  write = 53
+  getline = 54
+  json = 55
+  repr = 56
+  use = 57
+  opts = 58
+  ARRAY_SIZE = 59
+
+_builtin_str = {
+  1: 'builtin.colon',
+  2: 'builtin.dot',
+  3: 'builtin.exec_',
+  4: 'builtin.eval',
+  5: 'builtin.set',
+  6: 'builtin.shift',
+  7: 'builtin.times',
+  8: 'builtin.trap',
+  9: 'builtin.unset',
+  10: 'builtin.builtin',
+  11: 'builtin.readonly',
+  12: 'builtin.local',
+  13: 'builtin.declare',
+  14: 'builtin.typeset',
+  15: 'builtin.export_',
+  16: 'builtin.test',
+  17: 'builtin.bracket',
+  18: 'builtin.true_',
+  19: 'builtin.false_',
+  20: 'builtin.read',
+  21: 'builtin.echo',
+  22: 'builtin.printf',
+  23: 'builtin.mapfile',
+  24: 'builtin.readarray',
+  25: 'builtin.cd',
+  26: 'builtin.pushd',
+  27: 'builtin.popd',
+  28: 'builtin.dirs',
+  29: 'builtin.pwd',
+  30: 'builtin.source',
+  31: 'builtin.umask',
+  32: 'builtin.wait',
+  33: 'builtin.each',
+  34: 'builtin.jobs',
+  35: 'builtin.fg',
+  36: 'builtin.bg',
+  37: 'builtin.shopt',
+  38: 'builtin.complete',
+  39: 'builtin.compgen',
+  40: 'builtin.compopt',
+  41: 'builtin.compadjust',
+  42: 'builtin.getopts',
+  43: 'builtin.command',
+  44: 'builtin.type',
+  45: 'builtin.hash',
+  46: 'builtin.help',
+  47: 'builtin.history',
+  48: 'builtin.alias',
+  49: 'builtin.unalias',
+  50: 'builtin.bind',
+  51: 'builtin.push',
+  52: 'builtin.append',
+  53: 'builtin.write',
+  54: 'builtin.getline',
+  55: 'builtin.json',
+  56: 'builtin.repr',
+  57: 'builtin.use',
+  58: 'builtin.opts',
+}
+
+def builtin_str(val):
+  # type: (builtin_t) -> str
+  return _builtin_str[val]
+
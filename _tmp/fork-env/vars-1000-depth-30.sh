@@ -0,0 +1,1038 @@
+export VAR_0=value_0
+VAR_1=value_1
+VAR_2=value_2
+VAR_3=value_3
+VAR_4=value_4
+VAR_5=value_5
+VAR_6=value_6
+VAR_7=value_7
+VAR_8=value_8
+VAR_9=value_9
+export VAR_10=value_10
+VAR_11=value_11
+VAR_12=value_12
+VAR_13=value_13
+VAR_14=value_14
+VAR_15=value_15
+VAR_16=value_16
+VAR_17=value_17
+VAR_18=value_18
+VAR_19=value_19
+export VAR_20=value_20
+VAR_21=value_21
+VAR_22=value_22
+VAR_23=value_23
+VAR_24=value_24
+VAR_25=value_25
+VAR_26=value_26
+VAR_27=value_27
+VAR_28=value_28
+VAR_29=value_29
+export VAR_30=value_30
+VAR_31=value_31
+VAR_32=value_32
+VAR_33=value_33
+VAR_34=value_34
+VAR_35=value_35
+VAR_36=value_36
+VAR_37=value_37
+VAR_38=value_38
+VAR_39=value_39
+export VAR_40=value_40
+VAR_41=value_41
+VAR_42=value_42
+VAR_43=value_43
+VAR_44=value_44
+VAR_45=value_45
+VAR_46=value_46
+VAR_47=value_47
+VAR_48=value_48
+VAR_49=value_49
+export VAR_50=value_50
+VAR_51=value_51
+VAR_52=value_52
+VAR_53=value_53
+VAR_54=value_54
+VAR_55=value_55
+VAR_56=value_56
+VAR_57=value_57
+VAR_58=value_58
+VAR_59=value_59
+export VAR_60=value_60
+VAR_61=value_61
+VAR_62=value_62
+VAR_63=value_63
+VAR_64=value_64
+VAR_65=value_65
+VAR_66=value_66
+VAR_67=value_67
+VAR_68=value_68
+VAR_69=value_69
+export VAR_70=value_70
+VAR_71=value_71
+VAR_72=value_72
+VAR_73=value_73
+VAR_74=value_74
+VAR_75=value_75
+VAR_76=value_76
+VAR_77=value_77
+VAR_78=value_78
+VAR_79=value_79
+export VAR_80=value_80
+VAR_81=value_81
+VAR_82=value_82
+VAR_83=value_83
+VAR_84=value_84
+VAR_85=value_85
+VAR_86=value_86
+VAR_87=value_87
+VAR_88=value_88
+VAR_89=value_89
+export VAR_90=value_90
+VAR_91=value_91
+VAR_92=value_92
+VAR_93=value_93
+VAR_94=value_94
+VAR_95=value_95
+VAR_96=value_96
+VAR_97=value_97
+VAR_98=value_98
+VAR_99=value_99
+export VAR_100=value_100
+VAR_101=value_101
+VAR_102=value_102
+VAR_103=value_103
+VAR_104=value_104
+VAR_105=value_105
+VAR_106=value_106
+VAR_107=value_107
+VAR_108=value_108
+VAR_109=value_109
+export VAR_110=value_110
+VAR_111=value_111
+VAR_112=value_112
+VAR_113=value_113
+VAR_114=value_114
+VAR_115=value_115
+VAR_116=value_116
+VAR_117=value_117
+VAR_118=value_118
+VAR_119=value_119
+export VAR_120=value_120
+VAR_121=value_121
+VAR_122=value_122
+VAR_123=value_123
+VAR_124=value_124
+VAR_125=value_125
+VAR_126=value_126
+VAR_127=value_127
+VAR_128=value_128
+VAR_129=value_129
+export VAR_130=value_130
+VAR_131=value_131
+VAR_132=value_132
+VAR_133=value_133
+VAR_134=value_134
+VAR_135=value_135
+VAR_136=value_136
+VAR_137=value_137
+VAR_138=value_138
+VAR_139=value_139
+export VAR_140=value_140
+VAR_141=value_141
+VAR_142=value_142
+VAR_143=value_143
+VAR_144=value_144
+VAR_145=value_145
+VAR_146=value_146
+VAR_147=value_147
+VAR_148=value_148
+VAR_149=value_149
+export VAR_150=value_150
+VAR_151=value_151
+VAR_152=value_152
+VAR_153=value_153
+VAR_154=value_154
+VAR_155=value_155
+VAR_156=value_156
+VAR_157=value_157
+VAR_158=value_158
+VAR_159=value_159
+export VAR_160=value_160
+VAR_161=value_161
+VAR_162=value_162
+VAR_163=value_163
+VAR_164=value_164
+VAR_165=value_165
+VAR_166=value_166
+VAR_167=value_167
+VAR_168=value_168
+VAR_169=value_169
+export VAR_170=value_170
+VAR_171=value_171
+VAR_172=value_172
+VAR_173=value_173
+VAR_174=value_174
+VAR_175=value_175
+VAR_176=value_176
+VAR_177=value_177
+VAR_178=value_178
+VAR_179=value_179
+export VAR_180=value_180
+VAR_181=value_181
+VAR_182=value_182
+VAR_183=value_183
+VAR_184=value_184
+VAR_185=value_185
+VAR_186=value_186
+VAR_187=value_187
+VAR_188=value_188
+VAR_189=value_189
+export VAR_190=value_190
+VAR_191=value_191
+VAR_192=value_192
+VAR_193=value_193
+VAR_194=value_194
+VAR_195=value_195
+VAR_196=value_196
+VAR_197=value_197
+VAR_198=value_198
+VAR_199=value_199
+export VAR_200=value_200
+VAR_201=value_201
+VAR_202=value_202
+VAR_203=value_203
+VAR_204=value_204
+VAR_205=value_205
+VAR_206=value_206
+VAR_207=value_207
+VAR_208=value_208
+VAR_209=value_209
+export VAR_210=value_210
+VAR_211=value_211
+VAR_212=value_212
+VAR_213=value_213
+VAR_214=value_214
+VAR_215=value_215
+VAR_216=value_216
+VAR_217=value_217
+VAR_218=value_218
+VAR_219=value_219
+export VAR_220=value_220
+VAR_221=value_221
+VAR_222=value_222
+VAR_223=value_223
+VAR_224=value_224
+VAR_225=value_225
+VAR_226=value_226
+VAR_227=value_227
+VAR_228=value_228
+VAR_229=value_229
+export VAR_230=value_230
+VAR_231=value_231
+VAR_232=value_232
+VAR_233=value_233
+VAR_234=value_234
+VAR_235=value_235
+VAR_236=value_236
+VAR_237=value_237
+VAR_238=value_238
+VAR_239=value_239
+export VAR_240=value_240
+VAR_241=value_241
+VAR_242=value_242
+VAR_243=value_243
+VAR_244=value_244
+VAR_245=value_245
+VAR_246=value_246
+VAR_247=value_247
+VAR_248=value_248
+VAR_249=value_249
+export VAR_250=value_250
+VAR_251=value_251
+VAR_252=value_252
+VAR_253=value_253
+VAR_254=value_254
+VAR_255=value_255
+VAR_256=value_256
+VAR_257=value_257
+VAR_258=value_258
+VAR_259=value_259
+export VAR_260=value_260
+VAR_261=value_261
+VAR_262=value_262
+VAR_263=value_263
+VAR_264=value_264
+VAR_265=value_265
+VAR_266=value_266
+VAR_267=value_267
+VAR_268=value_268
+VAR_269=value_269
+export VAR_270=value_270
+VAR_271=value_271
+VAR_272=value_272
+VAR_273=value_273
+VAR_274=value_274
+VAR_275=value_275
+VAR_276=value_276
+VAR_277=value_277
+VAR_278=value_278
+VAR_279=value_279
+export VAR_280=value_280
+VAR_281=value_281
+VAR_282=value_282
+VAR_283=value_283
+VAR_284=value_284
+VAR_285=value_285
+VAR_286=value_286
+VAR_287=value_287
+VAR_288=value_288
+VAR_289=value_289
+export VAR_290=value_290
+VAR_291=value_291
+VAR_292=value_292
+VAR_293=value_293
+VAR_294=value_294
+VAR_295=value_295
+VAR_296=value_296
+VAR_297=value_297
+VAR_298=value_298
+VAR_299=value_299
+export VAR_300=value_300
+VAR_301=value_301
+VAR_302=value_302
+VAR_303=value_303
+VAR_304=value_304
+VAR_305=value_305
+VAR_306=value_306
+VAR_307=value_307
+VAR_308=value_308
+VAR_309=value_309
+export VAR_310=value_310
+VAR_311=value_311
+VAR_312=value_312
+VAR_313=value_313
+VAR_314=value_314
+VAR_315=value_315
+VAR_316=value_316
+VAR_317=value_317
+VAR_318=value_318
+VAR_319=value_319
+export VAR_320=value_320
+VAR_321=value_321
+VAR_322=value_322
+VAR_323=value_323
+VAR_324=value_324
+VAR_325=value_325
+VAR_326=value_326
+VAR_327=value_327
+VAR_328=value_328
+VAR_329=value_329
+export VAR_330=value_330
+VAR_331=value_331
+VAR_332=value_332
+VAR_333=value_333
+VAR_334=value_334
+VAR_335=value_335
+VAR_336=value_336
+VAR_337=value_337
+VAR_338=value_338
+VAR_339=value_339
+export VAR_340=value_340
+VAR_341=value_341
+VAR_342=value_342
+VAR_343=value_343
+VAR_344=value_344
+VAR_345=value_345
+VAR_346=value_346
+VAR_347=value_347
+VAR_348=value_348
+VAR_349=value_349
+export VAR_350=value_350
+VAR_351=value_351
+VAR_352=value_352
+VAR_353=value_353
+VAR_354=value_354
+VAR_355=value_355
+VAR_356=value_356
+VAR_357=value_357
+VAR_358=value_358
+VAR_359=value_359
+export VAR_360=value_360
+VAR_361=value_361
+VAR_362=value_362
+VAR_363=value_363
+VAR_364=value_364
+VAR_365=value_365
+VAR_366=value_366
+VAR_367=value_367
+VAR_368=value_368
+VAR_369=value_369
+export VAR_370=value_370
+VAR_371=value_371
+VAR_372=value_372
+VAR_373=value_373
+VAR_374=value_374
+VAR_375=value_375
+VAR_376=value_376
+VAR_377=value_377
+VAR_378=value_378
+VAR_379=value_379
+export VAR_380=value_380
+VAR_381=value_381
+VAR_382=value_382
+VAR_383=value_383
+VAR_384=value_384
+VAR_385=value_385
+VAR_386=value_386
+VAR_387=value_387
+VAR_388=value_388
+VAR_389=value_389
+export VAR_390=value_390
+VAR_391=value_391
+VAR_392=value_392
+VAR_393=value_393
+VAR_394=value_394
+VAR_395=value_395
+VAR_396=value_396
+VAR_397=value_397
+VAR_398=value_398
+VAR_399=value_399
+export VAR_400=value_400
+VAR_401=value_401
+VAR_402=value_402
+VAR_403=value_403
+VAR_404=value_404
+VAR_405=value_405
+VAR_406=value_406
+VAR_407=value_407
+VAR_408=value_408
+VAR_409=value_409
+export VAR_410=value_410
+VAR_411=value_411
+VAR_412=value_412
+VAR_413=value_413
+VAR_414=value_414
+VAR_415=value_415
+VAR_416=value_416
+VAR_417=value_417
+VAR_418=value_418
+VAR_419=value_419
+export VAR_420=value_420
+VAR_421=value_421
+VAR_422=value_422
+VAR_423=value_423
+VAR_424=value_424
+VAR_425=value_425
+VAR_426=value_426
+VAR_427=value_427
+VAR_428=value_428
+VAR_429=value_429
+export VAR_430=value_430
+VAR_431=value_431
+VAR_432=value_432
+VAR_433=value_433
+VAR_434=value_434
+VAR_435=value_435
+VAR_436=value_436
+VAR_437=value_437
+VAR_438=value_438
+VAR_439=value_439
+export VAR_440=value_440
+VAR_441=value_441
+VAR_442=value_442
+VAR_443=value_443
+VAR_444=value_444
+VAR_445=value_445
+VAR_446=value_446
+VAR_447=value_447
+VAR_448=value_448
+VAR_449=value_449
+export VAR_450=value_450
+VAR_451=value_451
+VAR_452=value_452
+VAR_453=value_453
+VAR_454=value_454
+VAR_455=value_455
+VAR_456=value_456
+VAR_457=value_457
+VAR_458=value_458
+VAR_459=value_459
+export VAR_460=value_460
+VAR_461=value_461
+VAR_462=value_462
+VAR_463=value_463
+VAR_464=value_464
+VAR_465=value_465
+VAR_466=value_466
+VAR_467=value_467
+VAR_468=value_468
+VAR_469=value_469
+export VAR_470=value_470
+VAR_471=value_471
+VAR_472=value_472
+VAR_473=value_473
+VAR_474=value_474
+VAR_475=value_475
+VAR_476=value_476
+VAR_477=value_477
+VAR_478=value_478
+VAR_479=value_479
+export VAR_480=value_480
+VAR_481=value_481
+VAR_482=value_482
+VAR_483=value_483
+VAR_484=value_484
+VAR_485=value_485
+VAR_486=value_486
+VAR_487=value_487
+VAR_488=value_488
+VAR_489=value_489
+export VAR_490=value_490
+VAR_491=value_491
+VAR_492=value_492
+VAR_493=value_493
+VAR_494=value_494
+VAR_495=value_495
+VAR_496=value_496
+VAR_497=value_497
+VAR_498=value_498
+VAR_499=value_499
+export VAR_500=value_500
+VAR_501=value_501
+VAR_502=value_502
+VAR_503=value_503
+VAR_504=value_504
+VAR_505=value_505
+VAR_506=value_506
+VAR_507=value_507
+VAR_508=value_508
+VAR_509=value_509
+export VAR_510=value_510
+VAR_511=value_511
+VAR_512=value_512
+VAR_513=value_513
+VAR_514=value_514
+VAR_515=value_515
+VAR_516=value_516
+VAR_517=value_517
+VAR_518=value_518
+VAR_519=value_519
+export VAR_520=value_520
+VAR_521=value_521
+VAR_522=value_522
+VAR_523=value_523
+VAR_524=value_524
+VAR_525=value_525
+VAR_526=value_526
+VAR_527=value_527
+VAR_528=value_528
+VAR_529=value_529
+export VAR_530=value_530
+VAR_531=value_531
+VAR_532=value_532
+VAR_533=value_533
+VAR_534=value_534
+VAR_535=value_535
+VAR_536=value_536
+VAR_537=value_537
+VAR_538=value_538
+VAR_539=value_539
+export VAR_540=value_540
+VAR_541=value_541
+VAR_542=value_542
+VAR_543=value_543
+VAR_544=value_544
+VAR_545=value_545
+VAR_546=value_546
+VAR_547=value_547
+VAR_548=value_548
+VAR_549=value_549
+export VAR_550=value_550
+VAR_551=value_551
+VAR_552=value_552
+VAR_553=value_553
+VAR_554=value_554
+VAR_555=value_555
+VAR_556=value_556
+VAR_557=value_557
+VAR_558=value_558
+VAR_559=value_559
+export VAR_560=value_560
+VAR_561=value_561
+VAR_562=value_562
+VAR_563=value_563
+VAR_564=value_564
+VAR_565=value_565
+VAR_566=value_566
+VAR_567=value_567
+VAR_568=value_568
+VAR_569=value_569
+export VAR_570=value_570
+VAR_571=value_571
+VAR_572=value_572
+VAR_573=value_573
+VAR_574=value_574
+VAR_575=value_575
+VAR_576=value_576
+VAR_577=value_577
+VAR_578=value_578
+VAR_579=value_579
+export VAR_580=value_580
+VAR_581=value_581
+VAR_582=value_582
+VAR_583=value_583
+VAR_584=value_584
+VAR_585=value_585
+VAR_586=value_586
+VAR_587=value_587
+VAR_588=value_588
+VAR_589=value_589
+export VAR_590=value_590
+VAR_591=value_591
+VAR_592=value_592
+VAR_593=value_593
+VAR_594=value_594
+VAR_595=value_595
+VAR_596=value_596
+VAR_597=value_597
+VAR_598=value_598
+VAR_599=value_599
+export VAR_600=value_600
+VAR_601=value_601
+VAR_602=value_602
+VAR_603=value_603
+VAR_604=value_604
+VAR_605=value_605
+VAR_606=value_606
+VAR_607=value_607
+VAR_608=value_608
+VAR_609=value_609
+export VAR_610=value_610
+VAR_611=value_611
+VAR_612=value_612
+VAR_613=value_613
+VAR_614=value_614
+VAR_615=value_615
+VAR_616=value_616
+VAR_617=value_617
+VAR_618=value_618
+VAR_619=value_619
+export VAR_620=value_620
+VAR_621=value_621
+VAR_622=value_622
+VAR_623=value_623
+VAR_624=value_624
+VAR_625=value_625
+VAR_626=value_626
+VAR_627=value_627
+VAR_628=value_628
+VAR_629=value_629
+export VAR_630=value_630
+VAR_631=value_631
+VAR_632=value_632
+VAR_633=value_633
+VAR_634=value_634
+VAR_635=value_635
+VAR_636=value_636
+VAR_637=value_637
+VAR_638=value_638
+VAR_639=value_639
+export VAR_640=value_640
+VAR_641=value_641
+VAR_642=value_642
+VAR_643=value_643
+VAR_644=value_644
+VAR_645=value_645
+VAR_646=value_646
+VAR_647=value_647
+VAR_648=value_648
+VAR_649=value_649
+export VAR_650=value_650
+VAR_651=value_651
+VAR_652=value_652
+VAR_653=value_653
+VAR_654=value_654
+VAR_655=value_655
+VAR_656=value_656
+VAR_657=value_657
+VAR_658=value_658
+VAR_659=value_659
+export VAR_660=value_660
+VAR_661=value_661
+VAR_662=value_662
+VAR_663=value_663
+VAR_664=value_664
+VAR_665=value_665
+VAR_666=value_666
+VAR_667=value_667
+VAR_668=value_668
+VAR_669=value_669
+export VAR_670=value_670
+VAR_671=value_671
+VAR_672=value_672
+VAR_673=value_673
+VAR_674=value_674
+VAR_675=value_675
+VAR_676=value_676
+VAR_677=value_677
+VAR_678=value_678
+VAR_679=value_679
+export VAR_680=value_680
+VAR_681=value_681
+VAR_682=value_682
+VAR_683=value_683
+VAR_684=value_684
+VAR_685=value_685
+VAR_686=value_686
+VAR_687=value_687
+VAR_688=value_688
+VAR_689=value_689
+export VAR_690=value_690
+VAR_691=value_691
+VAR_692=value_692
+VAR_693=value_693
+VAR_694=value_694
+VAR_695=value_695
+VAR_696=value_696
+VAR_697=value_697
+VAR_698=value_698
+VAR_699=value_699
+export VAR_700=value_700
+VAR_701=value_701
+VAR_702=value_702
+VAR_703=value_703
+VAR_704=value_704
+VAR_705=value_705
+VAR_706=value_706
+VAR_707=value_707
+VAR_708=value_708
+VAR_709=value_709
+export VAR_710=value_710
+VAR_711=value_711
+VAR_712=value_712
+VAR_713=value_713
+VAR_714=value_714
+VAR_715=value_715
+VAR_716=value_716
+VAR_717=value_717
+VAR_718=value_718
+VAR_719=value_719
+export VAR_720=value_720
+VAR_721=value_721
+VAR_722=value_722
+VAR_723=value_723
+VAR_724=value_724
+VAR_725=value_725
+VAR_726=value_726
+VAR_727=value_727
+VAR_728=value_728
+VAR_729=value_729
+export VAR_730=value_730
+VAR_731=value_731
+VAR_732=value_732
+VAR_733=value_733
+VAR_734=value_734
+VAR_735=value_735
+VAR_736=value_736
+VAR_737=value_737
+VAR_738=value_738
+VAR_739=value_739
+export VAR_740=value_740
+VAR_741=value_741
+VAR_742=value_742
+VAR_743=value_743
+VAR_744=value_744
+VAR_745=value_745
+VAR_746=value_746
+VAR_747=value_747
+VAR_748=value_748
+VAR_749=value_749
+export VAR_750=value_750
+VAR_751=value_751
+VAR_752=value_752
+VAR_753=value_753
+VAR_754=value_754
+VAR_755=value_755
+VAR_756=value_756
+VAR_757=value_757
+VAR_758=value_758
+VAR_759=value_759
+export VAR_760=value_760
+VAR_761=value_761
+VAR_762=value_762
+VAR_763=value_763
+VAR_764=value_764
+VAR_765=value_765
+VAR_766=value_766
+VAR_767=value_767
+VAR_768=value_768
+VAR_769=value_769
+export VAR_770=value_770
+VAR_771=value_771
+VAR_772=value_772
+VAR_773=value_773
+VAR_774=value_774
+VAR_775=value_775
+VAR_776=value_776
+VAR_777=value_777
+VAR_778=value_778
+VAR_779=value_779
+export VAR_780=value_780
+VAR_781=value_781
+VAR_782=value_782
+VAR_783=value_783
+VAR_784=value_784
+VAR_785=value_785
+VAR_786=value_786
+VAR_787=value_787
+VAR_788=value_788
+VAR_789=value_789
+export VAR_790=value_790
+VAR_791=value_791
+VAR_792=value_792
+VAR_793=value_793
+VAR_794=value_794
+VAR_795=value_795
+VAR_796=value_796
+VAR_797=value_797
+VAR_798=value_798
+VAR_799=value_799
+export VAR_800=value_800
+VAR_801=value_801
+VAR_802=value_802
+VAR_803=value_803
+VAR_804=value_804
+VAR_805=value_805
+VAR_806=value_806
+VAR_807=value_807
+VAR_808=value_808
+VAR_809=value_809
+export VAR_810=value_810
+VAR_811=value_811
+VAR_812=value_812
+VAR_813=value_813
+VAR_814=value_814
+VAR_815=value_815
+VAR_816=value_816
+VAR_817=value_817
+VAR_818=value_818
+VAR_819=value_819
+export VAR_820=value_820
+VAR_821=value_821
+VAR_822=value_822
+VAR_823=value_823
+VAR_824=value_824
+VAR_825=value_825
+VAR_826=value_826
+VAR_827=value_827
+VAR_828=value_828
+VAR_829=value_829
+export VAR_830=value_830
+VAR_831=value_831
+VAR_832=value_832
+VAR_833=value_833
+VAR_834=value_834
+VAR_835=value_835
+VAR_836=value_836
+VAR_837=value_837
+VAR_838=value_838
+VAR_839=value_839
+export VAR_840=value_840
+VAR_841=value_841
+VAR_842=value_842
+VAR_843=value_843
+VAR_844=value_844
+VAR_845=value_845
+VAR_846=value_846
+VAR_847=value_847
+VAR_848=value_848
+VAR_849=value_849
+export VAR_850=value_850
+VAR_851=value_851
+VAR_852=value_852
+VAR_853=value_853
+VAR_854=value_854
+VAR_855=value_855
+VAR_856=value_856
+VAR_857=value_857
+VAR_858=value_858
+VAR_859=value_859
+export VAR_860=value_860
+VAR_861=value_861
+VAR_862=value_862
+VAR_863=value_863
+VAR_864=value_864
+VAR_865=value_865
+VAR_866=value_866
+VAR_867=value_867
+VAR_868=value_868
+VAR_869=value_869
+export VAR_870=value_870
+VAR_871=value_871
+VAR_872=value_872
+VAR_873=value_873
+VAR_874=value_874
+VAR_875=value_875
+VAR_876=value_876
+VAR_877=value_877
+VAR_878=value_878
+VAR_879=value_879
+export VAR_880=value_880
+VAR_881=value_881
+VAR_882=value_882
+VAR_883=value_883
+VAR_884=value_884
+VAR_885=value_885
+VAR_886=value_886
+VAR_887=value_887
+VAR_888=value_888
+VAR_889=value_889
+export VAR_890=value_890
+VAR_891=value_891
+VAR_892=value_892
+VAR_893=value_893
+VAR_894=value_894
+VAR_895=value_895
+VAR_896=value_896
+VAR_897=value_897
+VAR_898=value_898
+VAR_899=value_899
+export VAR_900=value_900
+VAR_901=value_901
+VAR_902=value_902
+VAR_903=value_903
+VAR_904=value_904
+VAR_905=value_905
+VAR_906=value_906
+VAR_907=value_907
+VAR_908=value_908
+VAR_909=value_909
+export VAR_910=value_910
+VAR_911=value_911
+VAR_912=value_912
+VAR_913=value_913
+VAR_914=value_914
+VAR_915=value_915
+VAR_916=value_916
+VAR_917=value_917
+VAR_918=value_918
+VAR_919=value_919
+export VAR_920=value_920
+VAR_921=value_921
+VAR_922=value_922
+VAR_923=value_923
+VAR_924=value_924
+VAR_925=value_925
+VAR_926=value_926
+VAR_927=value_927
+VAR_928=value_928
+VAR_929=value_929
+export VAR_930=value_930
+VAR_931=value_931
+VAR_932=value_932
+VAR_933=value_933
+VAR_934=value_934
+VAR_935=value_935
+VAR_936=value_936
+VAR_937=value_937
+VAR_938=value_938
+VAR_939=value_939
+export VAR_940=value_940
+VAR_941=value_941
+VAR_942=value_942
+VAR_943=value_943
+VAR_944=value_944
+VAR_945=value_945
+VAR_946=value_946
+VAR_947=value_947
+VAR_948=value_948
+VAR_949=value_949
+export VAR_950=value_950
+VAR_951=value_951
+VAR_952=value_952
+VAR_953=value_953
+VAR_954=value_954
+VAR_955=value_955
+VAR_956=value_956
+VAR_957=value_957
+VAR_958=value_958
+VAR_959=value_959
+export VAR_960=value_960
+VAR_961=value_961
+VAR_962=value_962
+VAR_963=value_963
+VAR_964=value_964
+VAR_965=value_965
+VAR_966=value_966
+VAR_967=value_967
+VAR_968=value_968
+VAR_969=value_969
+export VAR_970=value_970
+VAR_971=value_971
+VAR_972=value_972
+VAR_973=value_973
+VAR_974=value_974
+VAR_975=value_975
+VAR_976=value_976
+VAR_977=value_977
+VAR_978=value_978
+VAR_979=value_979
+export VAR_980=value_980
+VAR_981=value_981
+VAR_982=value_982
+VAR_983=value_983
+VAR_984=value_984
+VAR_985=value_985
+VAR_986=value_986
+VAR_987=value_987
+VAR_988=value_988
+VAR_989=value_989
+export VAR_990=value_990
+VAR_991=value_991
+VAR_992=value_992
+VAR_993=value_993
+VAR_994=value_994
+VAR_995=value_995
+VAR_996=value_996
+VAR_997=value_997
+VAR_998=value_998
+VAR_999=value_999
+work() {
+  j=0
+  while test $j -lt 300; do
+    /bin/true
+    j=$(( j + 1 ))
+  done
+}
+f0() { local frame_0=0; f1; }
+f1() { local frame_1=1; f2; }
+f2() { local frame_2=2; f3; }
+f3() { local frame_3=3; f4; }
+f4() { local frame_4=4; f5; }
+f5() { local frame_5=5; f6; }
+f6() { local frame_6=6; f7; }
+f7() { local frame_7=7; f8; }
+f8() { local frame_8=8; f9; }
+f9() { local frame_9=9; f10; }
+f10() { local frame_10=10; f11; }
+f11() { local frame_11=11; f12; }
+f12() { local frame_12=12; f13; }
+f13() { local frame_13=13; f14; }
+f14() { local frame_14=14; f15; }
+f15() { local frame_15=15; f16; }
+f16() { local frame_16=16; f17; }
+f17() { local frame_17=17; f18; }
+f18() { local frame_18=18; f19; }
+f19() { local frame_19=19; f20; }
+f20() { local frame_20=20; f21; }
+f21() { local frame_21=21; f22; }
+f22() { local frame_22=22; f23; }
+f23() { local frame_23=23; f24; }
+f24() { local frame_24=24; f25; }
+f25() { local frame_25=25; f26; }
+f26() { local frame_26=26; f27; }
+f27() { local frame_27=27; f28; }
+f28() { local frame_28=28; f29; }
+f29() { local frame_29=29; work; }
+f0
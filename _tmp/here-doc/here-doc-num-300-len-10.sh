@@ -0,0 +1,8 @@
+i=0
+while test $i -lt 300; do
+  read line <<EOF
+xxxxxxxxxx $i
+EOF
+  i=$(( i + 1 ))
+done
+echo "$line"
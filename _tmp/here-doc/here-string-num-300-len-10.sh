@@ -0,0 +1,6 @@
+i=0
+while test $i -lt 300; do
+  read line <<< "xxxxxxxxxx $i"
+  i=$(( i + 1 ))
+done
+echo "$line"
@@ -0,0 +1,9 @@
+i=0
+while test $i -lt 300; do
+  read line <<EOF
+xxxxxxxxxx $i
+EOF
+  read line <<< "xxxxxxxxxx $i"
+  i=$(( i + 1 ))
+done
+echo "$line"